@@ -25,11 +25,43 @@ import zipfile
 import json
 import tomllib
 import re
+import mmap
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 
-console = Console()
+# orjson is optional; it parses fabric.mod.json noticeably faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Output is plain text and markup, so skip Rich's repr highlighter
+console = Console(highlight=False)
+
+# Java prints "Caused by:" at the start of a line, so anchor the match there
+CAUSED_BY_RE = re.compile(r"^Caused by: ([\w.]+): (.+)$", re.MULTILINE)
+
+# Only the end of a crash log is scanned; the root causes are printed last
+CRASH_LOG_TAIL = 256 * 1024
+
+# Parsed mod info is reused across runs for jars that haven't changed
+MOD_CACHE_PATH = Path.home() / ".cache" / "mc-mod-analyzer" / "index.json"
+# Bump when extract_mod_info output changes so stale results are discarded
+MOD_CACHE_VERSION = 1
+MOD_INFO_KEYS = frozenset({"file", "id", "name", "version", "type", "requires", "failed"})
+
+# Jars above this size are memory-mapped instead of read through stdio
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Real manifests are a few KB; anything past this is not worth inflating
+MANIFEST_MAX_SIZE = 1024 * 1024
+
+# Dependencies provided by the game or loader itself, never installed as mods
+BUILTIN_DEPS = frozenset({"forge", "minecraft", "java", "fabricloader", "neoforge"})
 
 # === SPLASH SCREEN ===
 def clear_screen():
@@ -87,85 +119,241 @@ def detect_default_minecraft_folder() -> Path | None:
     return mods_path if mods_path.exists() else None
 
 
+class _MappedJar(mmap.mmap):
+    """Read-only mmap that ZipFile accepts as a seekable file object."""
+
+    def seekable(self):
+        return True
+
+
+@contextmanager
+def open_jar(jar_path):
+    """Open a jar as a ZipFile, memory-mapping it when it is large."""
+    if os.path.getsize(jar_path) <= MMAP_MIN_SIZE:
+        with zipfile.ZipFile(jar_path, 'r') as jar:
+            yield jar
+        return
+    # Only the central directory and manifest pages get faulted in
+    with open(jar_path, 'rb') as fp, \
+            _MappedJar(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            zipfile.ZipFile(mm, 'r') as jar:
+        yield jar
+
+
+def _classify_jar(names):
+    """Detect mod loader type from the set of entry names in a jar."""
+    # Manifests live at fixed paths, so exact set lookups are enough
+    if "fabric.mod.json" in names:
+        return "Fabric"
+    if "quilt.mod.json" in names:
+        return "Quilt"
+    if "META-INF/mods.toml" in names:
+        return "Forge"
+    if "META-INF/neoforge.mods.toml" in names:
+        return "NeoForge"
+    return "Unknown"
+
+
+def _read_manifest(jar, name):
+    """Read a manifest from the jar in one call, refusing oversized entries."""
+    if jar.getinfo(name).file_size > MANIFEST_MAX_SIZE:
+        raise ValueError(f"{name} is too large")
+    return jar.read(name)
+
+
 def detect_mod_type(jar_path):
     """Detect mod loader type based on file structure."""
-    with zipfile.ZipFile(jar_path, 'r') as jar:
-        files = jar.namelist()
-        if any("fabric.mod.json" in f for f in files):
-            return "Fabric"
-        if any("quilt.mod.json" in f for f in files):
-            return "Quilt"
-        if any("META-INF/mods.toml" in f for f in files):
-            return "Forge"
-        if any("META-INF/neoforge.mods.toml" in f for f in files):
-            return "NeoForge"
-    return "Unknown"
+    try:
+        with open_jar(jar_path) as jar:
+            return _classify_jar(set(jar.namelist()))
+    except Exception:
+        return "Unknown"
+
+
+def json_loads(data):
+    """Parse JSON bytes with orjson when available, else the stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # stdlib also accepts a UTF-8 BOM, NaN and Infinity
+    return json.loads(data)
+
+
+def _parse_fabric(jar):
+    """Read mod info from fabric.mod.json (also used for Quilt jars)."""
+    data = json_loads(_read_manifest(jar, "fabric.mod.json"))
+    mod_id = data.get("id")
+    return {
+        "id": mod_id,
+        "name": data.get("name", mod_id),
+        "version": data.get("version"),
+        "requires": list(data.get("depends", {}).keys()),
+    }
+
+
+def _parse_mods_toml(jar, toml_path):
+    """Read mod info from a Forge-style mods.toml manifest."""
+    data = tomllib.loads(_read_manifest(jar, toml_path).decode("utf-8"))
+    mod = data["mods"][0]
+    mod_id = mod.get("modId")
+    return {
+        "id": mod_id,
+        "name": mod.get("displayName", mod_id),
+        "version": mod.get("version"),
+        "requires": [
+            dep["modId"]
+            for dep in data.get("dependencies", {}).get(mod_id, [])
+            if "modId" in dep
+        ],
+    }
+
+
+def _parse_forge(jar):
+    """Read mod info from a Forge jar."""
+    return _parse_mods_toml(jar, "META-INF/mods.toml")
+
+
+def _parse_neoforge(jar):
+    """Read mod info from a NeoForge jar."""
+    return _parse_mods_toml(jar, "META-INF/neoforge.mods.toml")
+
+
+# Manifest parser for each loader type reported by _classify_jar
+_LOADER_PARSERS = {
+    "Fabric": _parse_fabric,
+    "Quilt": _parse_fabric,
+    "Forge": _parse_forge,
+    "NeoForge": _parse_neoforge,
+}
 
 
 def extract_mod_info(jar_path):
     """Extract mod ID, name, version and dependencies."""
-    mod_type = detect_mod_type(jar_path)
-    mod_id, mod_name, mod_version, requires = None, None, None, []
+    mod_type = "Unknown"
+    info = {}
+    failed = False
 
     try:
-        with zipfile.ZipFile(jar_path, 'r') as jar:
-            if mod_type in ("Fabric", "Quilt"):
-                with jar.open("fabric.mod.json") as f:
-                    data = json.load(f)
-                    mod_id = data.get("id")
-                    mod_name = data.get("name", mod_id)
-                    mod_version = data.get("version")
-                    requires = list(data.get("depends", {}).keys())
-
-            elif mod_type in ("Forge", "NeoForge"):
-                toml_path = (
-                    "META-INF/neoforge.mods.toml"
-                    if mod_type == "NeoForge"
-                    else "META-INF/mods.toml"
-                )
-                with jar.open(toml_path) as f:
-                    data = tomllib.load(f)
-                    mod = data["mods"][0]
-                    mod_id = mod.get("modId")
-                    mod_name = mod.get("displayName", mod_id)
-                    mod_version = mod.get("version")
-                    requires = [
-                        dep["modId"]
-                        for dep in data.get("dependencies", {}).get(mod_id, [])
-                        if "modId" in dep
-                    ]
+        # Classify and read the manifest through a single open of the jar
+        with open_jar(jar_path) as jar:
+            mod_type = _classify_jar(set(jar.namelist()))
+            parser = _LOADER_PARSERS.get(mod_type)
+            if parser:
+                info = parser(jar)
     except Exception:
-        pass
+        failed = True
 
     return {
         "file": os.path.basename(jar_path),
-        "id": mod_id or "unknown",
-        "name": mod_name or os.path.basename(jar_path),
-        "version": mod_version or "?",
+        "id": info.get("id") or "unknown",
+        "name": info.get("name") or os.path.basename(jar_path),
+        "version": info.get("version") or "?",
         "type": mod_type,
-        "requires": requires,
+        "requires": info.get("requires", []),
+        "failed": failed,
     }
 
 
+def parallel_map(func, files):
+    """Apply func to each jar, using a process pool for larger batches."""
+    if len(files) < 4:
+        # Not worth paying the pool startup cost for a handful of jars
+        return [func(file) for file in files]
+    # The default worker count is already capped at 61 on Windows
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(func, files, chunksize=4))
+
+
+def load_mod_cache():
+    """Load cached mod info keyed by jar path, or an empty cache."""
+    try:
+        with open(MOD_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MOD_CACHE_VERSION:
+        return {}
+    mods = data.get("mods")
+    return mods if isinstance(mods, dict) else {}
+
+
+def save_mod_cache(cache):
+    """Write the mod info cache back to disk, ignoring failures."""
+    try:
+        MOD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(MOD_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"version": MOD_CACHE_VERSION, "mods": cache}, f)
+    except OSError:
+        pass
+
+
+def cached_mod_info(cache, key, fingerprint):
+    """Return cached info for an unchanged jar, or None on a miss."""
+    entry = cache.get(key)
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    info = entry.get("info")
+    # Treat hand-edited or outdated entries as misses rather than failing later
+    if not isinstance(info, dict) or not MOD_INFO_KEYS <= info.keys():
+        return None
+    return info
+
+
+def jar_fingerprint(entry):
+    """Return the (mtime_ns, size) pair used to detect changed jars."""
+    st = entry.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _iter_logs(log_dir):
+    """Yield paths of all .log files under log_dir, recursively."""
+    try:
+        it = os.scandir(log_dir)
+    except OSError:
+        return  # missing or unreadable folders are skipped, like rglob does
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_logs(entry.path)
+            elif entry.is_file() and os.path.normcase(entry.name).endswith(".log"):
+                yield entry.path
+
+
+def _scan_one(path) -> list[str]:
+    """Return the "Caused by" lines found near the end of one log file."""
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if size > CRASH_LOG_TAIL:
+                f.seek(-CRASH_LOG_TAIL, os.SEEK_END)
+                f.readline()  # drop the partial first line
+            text = f.read().decode("utf-8", errors="ignore")
+    except Exception:
+        return []
+    # Most logs have no "Caused by" at all; skip the regex for those
+    if "Caused by:" not in text:
+        return []
+    return [match.group(0).rstrip() for match in CAUSED_BY_RE.finditer(text)]
+
+
 def analyze_crash_logs(log_dir):
     """Scan crash logs for recent errors."""
-    if not os.path.exists(log_dir):
+    files = list(_iter_logs(log_dir))
+    if not files:
         return None
 
+    # Reads release the GIL, so threads overlap the disk I/O between logs
     errors = []
-    for file in Path(log_dir).rglob("*.log"):
-        try:
-            with open(file, errors="ignore") as f:
-                text = f.read()
-                for match in re.finditer(r"Caused by: ([\w\.]+): (.+)", text):
-                    errors.append(match.group(0))
-        except Exception:
-            continue
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+        for hits in ex.map(_scan_one, files):
+            errors.extend(hits)
     return errors[-5:] if errors else None
 
 
-def main(mods_path=None):
-    show_splash()
+def main(mods_path=None, splash=True):
+    if splash:
+        show_splash()
 
     # Try to auto-detect Minecraft folder if no path is provided
     if not mods_path:
@@ -178,54 +366,110 @@ def main(mods_path=None):
             return
 
     mods_path = Path(mods_path)
-    if not mods_path.exists():
+    # One directory read gives both the existence check and the jar list
+    try:
+        with os.scandir(mods_path) as it:
+            # normcase folds ".JAR" on Windows only, matching Path.glob
+            jars = [
+                e for e in it
+                if e.is_file() and os.path.normcase(e.name).endswith(".jar")
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         console.print(f"[red]Mods folder not found: {mods_path}[/red]")
         return
+    except OSError:
+        jars = []  # unreadable folder; glob() used to yield nothing here too
 
-    mods = []
-    for file in mods_path.glob("*.jar"):
-        info = extract_mod_info(file)
-        mods.append(info)
-
-    if not mods:
+    if not jars:
         console.print("[red]No mods found in this folder.[/red]")
         return
 
+    cache = load_mod_cache()
+    base = os.path.realpath(mods_path)
+    paths = [e.path for e in jars]
+    names = [e.name for e in jars]
+    keys = [os.path.join(base, e.name) for e in jars]
+    fingerprints = [jar_fingerprint(e) for e in jars]
+
+    # Reuse parsed info for jars that haven't changed since the last run
+    infos = {}
+    for i, (key, fp) in enumerate(zip(keys, fingerprints)):
+        info = cached_mod_info(cache, key, fp)
+        if info is not None:
+            infos[i] = info
+
+    # Pass 1: the loader type alone decides what gets deleted
+    unparsed = [i for i in range(len(paths)) if i not in infos]
+    types = {i: info["type"] for i, info in infos.items()}
+    detected = parallel_map(detect_mod_type, [paths[i] for i in unparsed])
+    types.update(zip(unparsed, detected))
+
     # Count mods per loader
-    loader_count = {}
-    for m in mods:
-        loader_count[m["type"]] = loader_count.get(m["type"], 0) + 1
+    # Count in folder order so ties don't depend on which jars were cached
+    loader_count = Counter(types[i] for i in range(len(paths)))
 
     # Ignore Unknown
-    if "Unknown" in loader_count:
-        loader_count.pop("Unknown")
+    loader_count.pop("Unknown", None)
+    if not loader_count:
+        console.print("[red]No mods with a recognized loader found.[/red]")
+        return
 
     # Find dominant loader
-    dominant_loader = max(loader_count, key=loader_count.get)
+    dominant_loader = loader_count.most_common(1)[0][0]
 
     console.print(f"\n[cyan]Dominant loader detected:[/cyan] [bold]{dominant_loader}[/bold]\n")
 
     # Delete non-dominant mods
-    delete_candidates = [m for m in mods if m["type"] != dominant_loader and m["type"] != "Unknown"]
+    delete_candidates = [
+        i for i in range(len(paths))
+        if types[i] != dominant_loader and types[i] != "Unknown"
+    ]
+    deleted = set()
 
     if delete_candidates:
         console.print(f"[yellow]Found {len(delete_candidates)} mods from other loaders.[/yellow]")
         choice = input("Delete conflicting mods? [y/n]: ").strip().lower()
         if choice == "y":
-            for m in delete_candidates:
+            msgs = []
+            for i in delete_candidates:
                 try:
-                    os.remove(mods_path / m["file"])
-                    console.print(f"[red]- Deleted:[/red] {m['file']}")
+                    os.unlink(paths[i])
+                    deleted.add(i)
+                    msgs.append(f"[red]- Deleted:[/red] {names[i]}")
                 except Exception as e:
-                    console.print(f"[red]Failed to delete {m['file']}: {e}[/red]")
+                    msgs.append(f"[red]Failed to delete {names[i]}: {e}[/red]")
+            console.print("\n".join(msgs))
         else:
             console.print("[green]Skipping deletion.[/green]")
     else:
         console.print("[green]All mods match the same loader type![/green]")
 
+    # Pass 2: fully parse only the jars still left in the folder
+    remaining = [i for i in range(len(paths)) if i not in deleted]
+    to_parse = [i for i in remaining if i not in infos]
+    parsed = parallel_map(extract_mod_info, [paths[i] for i in to_parse])
+    for i, info in zip(to_parse, parsed):
+        infos[i] = info
+        if info["failed"]:
+            # Don't pin a one-off failure (e.g. a locked jar) to this fingerprint
+            cache.pop(keys[i], None)
+        else:
+            cache[keys[i]] = {"fingerprint": fingerprints[i], "info": info}
+
+    # Drop entries for jars that are no longer in this folder
+    present = {keys[i] for i in remaining}
+    gone = [k for k in cache if os.path.dirname(k) == base and k not in present]
+    for k in gone:
+        del cache[k]
+    if to_parse or gone:
+        save_mod_cache(cache)
+
+    mods = [infos[i] for i in remaining]
+
     # Analyze duplicates & missing deps
-    mod_ids = [m["id"] for m in mods]
-    duplicates = {i for i in mod_ids if mod_ids.count(i) > 1 and i != "unknown"}
+    id_counts = Counter(m["id"] for m in mods)
+    duplicates = {i for i, c in id_counts.items() if c > 1 and i != "unknown"}
+    known = set(id_counts) | BUILTIN_DEPS
 
     table = Table(title="Minecraft Mod Analyzer", style="cyan")
     table.add_column("Mod Name", justify="left", style="bold")
@@ -238,7 +482,7 @@ def main(mods_path=None):
         if m["id"] in duplicates:
             status = "⚠ Duplicate mod ID"
         else:
-            missing = [dep for dep in m["requires"] if dep not in mod_ids and dep not in ["forge", "minecraft"]]
+            missing = [dep for dep in m["requires"] if dep not in known]
             if missing:
                 status = f"⚠ Install missing mods: {', '.join(missing)}"
         table.add_row(m["name"], m["type"], m["version"], status)
@@ -249,12 +493,15 @@ def main(mods_path=None):
     errors = analyze_crash_logs(crash_dir)
     if errors:
         console.print("\n[red bold]Recent Crash Log Entries:[/red bold]")
-        for err in errors:
-            console.print(f"• {err}")
+        console.print("\n".join(f"• {err}" for err in errors))
 
     console.print("\n[green]Scan complete![/green]")
 
 
 if __name__ == "__main__":
-    arg_path = sys.argv[1] if len(sys.argv) > 1 else None
-    main(arg_path)
+    args = sys.argv[1:]
+    # Scripted runs can skip the ~3 s splash animation
+    splash = "--no-splash" not in args and not os.environ.get("MCMOD_NO_SPLASH")
+    args = [a for a in args if a != "--no-splash"]
+    arg_path = args[0] if args else None
+    main(arg_path, splash=splash)